@@ -7,7 +7,7 @@ Run this after setting up the database schema
 import os
 from dotenv import load_dotenv
 import pandas as pd
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import sessionmaker
 from database import Language, Term, Base
 
@@ -34,40 +34,48 @@ def migrate_data():
         if not arabic_lang:
             arabic_lang = Language(code="ar", name="Arabic")
             db.add(arabic_lang)
-            db.commit()
-            db.refresh(arabic_lang)
+            # Flush (not commit) so the id is populated without expiring the row
+            db.flush()
         
         # Read CSV
         df = pd.read_csv(csv_path)
         
+        # Fetch existing terms once instead of querying per row
+        existing = set(
+            db.query(Term.english_term, Term.target_language_term)
+            .filter(Term.language_id == arabic_lang.id)
+            .all()
+        )
+
         # Map CSV columns to database columns
+        rows = []
         for _, row in df.iterrows():
             # Skip rows with NaN values in required fields
             if pd.isna(row["Words (English)"]) or pd.isna(row["Word (Arabic script)"]):
                 continue
-                
-            # Check if term already exists
-            existing_term = db.query(Term).filter(
-                Term.english_term == row["Words (English)"],
-                Term.target_language_term == row["Word (Arabic script)"]
-            ).first()
-            
-            if not existing_term:
-                term = Term(
-                    language_id=arabic_lang.id,
-                    english_term=str(row["Words (English)"]),
-                    target_language_term=str(row["Word (Arabic script)"]),
-                    transliteration=str(row.get("Word (Arabic with Roman characters)")) if not pd.isna(row.get("Word (Arabic with Roman characters)")) else None,
-                    example_sentence=str(row.get("Sample sentence (Arabic)")) if not pd.isna(row.get("Sample sentence (Arabic)")) else None,
-                    example_sentence_explained=str(row.get("Sample sentence explained")) if not pd.isna(row.get("Sample sentence explained")) else None,
-                    notes=str(row.get("Notes")) if not pd.isna(row.get("Notes")) else None,
-                    learned=bool(row.get("Learned", 0)),
-                    correct_counter=int(row.get("Correct Counter", 0))
-                )
-                db.add(term)
-        
+
+            key = (str(row["Words (English)"]), str(row["Word (Arabic script)"]))
+            if key in existing:
+                continue
+            existing.add(key)
+
+            rows.append(dict(
+                language_id=arabic_lang.id,
+                english_term=key[0],
+                target_language_term=key[1],
+                transliteration=str(row.get("Word (Arabic with Roman characters)")) if not pd.isna(row.get("Word (Arabic with Roman characters)")) else None,
+                example_sentence=str(row.get("Sample sentence (Arabic)")) if not pd.isna(row.get("Sample sentence (Arabic)")) else None,
+                example_sentence_explained=str(row.get("Sample sentence explained")) if not pd.isna(row.get("Sample sentence explained")) else None,
+                notes=str(row.get("Notes")) if not pd.isna(row.get("Notes")) else None,
+                learned=bool(row.get("Learned", 0)),
+                correct_counter=int(row.get("Correct Counter", 0))
+            ))
+
+        # One executemany-style INSERT for all new rows
+        if rows:
+            db.execute(insert(Term), rows)
         db.commit()
-        print(f"Successfully migrated {len(df)} terms to database")
+        print(f"Successfully migrated {len(rows)} terms to database")
         
     except Exception as e:
         db.rollback()
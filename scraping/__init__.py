@@ -2,5 +2,6 @@
 Scraping utilities for Spellunker.
 
 This package currently contains the Duolingo Practice Hub words scraper.
+The shared scraping loop lives in `scraping._core`; entry points such as
+`scripts/scrape_duolingo_words.py` supply the browser page and an output sink.
 """
-
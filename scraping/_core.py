@@ -0,0 +1,217 @@
+"""
+Shared Duolingo Practice Hub words scraping logic.
+
+Callers attach to (or open) the Words page themselves and pass the page to
+`scrape_words` together with a sink that persists each batch of new pairs.
+"""
+
+import re
+from enum import Enum
+from typing import Awaitable, Callable, List, Set, Tuple
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+# Plain CSS (no XPath or Playwright-only pseudo-classes) so the same
+# selector works both in locators and in document.querySelectorAll.
+WORD_ITEMS_SELECTOR = "section ul li"
+
+# Only text is scraped, so these are never needed. Stylesheets are kept:
+# the visibility checks on the "More" button depend on layout.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+Sink = Callable[[List[Tuple[str, str]]], Awaitable[None]]
+
+
+class MoreResult(Enum):
+    """Outcome of one attempt to load more words."""
+
+    NOT_FOUND = "not_found"  # no "More" control on the page
+    NO_GROWTH = "no_growth"  # clicked, but the list did not grow in time
+    GREW = "grew"
+
+
+def parse_expected_count(text: str) -> int:
+    # e.g. "427 words"
+    m = re.search(r"(\d[\d,]*)", text)
+    if not m:
+        return -1
+    return int(m.group(1).replace(",", ""))
+
+
+async def get_expected_count(page) -> int:
+    # Look for an h2 like "427 words"; the filter runs inside the page
+    h2 = page.locator("h2", has_text=re.compile(r"\d[\d,]*\s+words?", re.IGNORECASE)).first
+    try:
+        txt = (await h2.inner_text()).strip()
+        return parse_expected_count(txt)
+    except Exception:
+        return -1
+
+
+EXTRACT_WORDS_JS = """
+(els, start) => ({
+    total: els.length,
+    items: els.slice(start).map(li => {
+        const h3 = li.querySelector('h3');
+        const p = li.querySelector('p');
+        if (!h3 || !p) return null;
+        const word = h3.innerText.trim();
+        const trans = p.innerText.trim();
+        return word && trans ? [word, trans] : null;
+    }).filter(Boolean),
+})
+"""
+
+
+async def extract_visible_words(page, start: int = 0) -> Tuple[List[Tuple[str, str]], int]:
+    """
+    Duolingo uses randomized classnames, so we anchor on structure:
+    list items that contain an <h3> (word) and a <p> (translation).
+    Items before `start` were already scraped and are skipped; the new
+    items are read in a single browser round-trip. Returns the pairs (in
+    page order) and the total item count, which is also the index to
+    resume from.
+    """
+    result = await page.locator(WORD_ITEMS_SELECTOR).evaluate_all(EXTRACT_WORDS_JS, start)
+    return [(word, trans) for word, trans in result["items"]], result["total"]
+
+
+async def wait_for_more_items(page, prev: int, timeout: int = 10_000) -> bool:
+    """
+    Wait until the word list grows past `prev` items instead of sleeping
+    for a fixed amount of time. Returns False if nothing new appeared.
+    """
+    try:
+        await page.wait_for_function(
+            "([sel, n]) => document.querySelectorAll(sel).length > n",
+            arg=[WORD_ITEMS_SELECTOR, prev],
+            timeout=timeout,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def click_and_wait(page, loc, prev: int) -> MoreResult:
+    await loc.scroll_into_view_if_needed()
+    await loc.click()
+    grew = await wait_for_more_items(page, prev)
+    return MoreResult.GREW if grew else MoreResult.NO_GROWTH
+
+
+async def click_more_if_possible(page, prev: int) -> MoreResult:
+    """
+    Click the button that loads more, if present, and wait for the list to
+    grow past `prev` items (the count from the last extraction).
+    Duolingo label varies; we try a few common text matches.
+    """
+    # 1) Try an accessible button with a name containing "more" (case‑insensitive).
+    try:
+        btn = page.get_by_role("button", name=re.compile("more", re.IGNORECASE))
+        if await btn.count() > 0 and await btn.first.is_visible():
+            print("Clicking 'More' via ARIA role/name.")
+            return await click_and_wait(page, btn.first, prev)
+    except Exception:
+        pass
+
+    # 2) Try common button text variants (case‑sensitive CSS :has-text).
+    selector_variants = [
+        "button:has-text('More')",
+        "button:has-text('more')",
+        "button:has-text('Show more')",
+        "button:has-text('Load more')",
+        "button:has-text('See more')",
+    ]
+    for sel in selector_variants:
+        loc = page.locator(sel).first
+        try:
+            if await loc.is_visible():
+                print(f"Clicking 'More' via selector: {sel}")
+                return await click_and_wait(page, loc, prev)
+        except Exception:
+            continue
+
+    # 3) Fallback: any element inside the words section whose text contains "more".
+    try:
+        words_section = page.locator("section", has=page.locator("ul li h3")).first
+        text_more = words_section.get_by_text(re.compile("more", re.IGNORECASE))
+        if await text_more.count() > 0 and await text_more.first.is_visible():
+            print("Clicking 'More' via generic text match inside words section.")
+            return await click_and_wait(page, text_more.first, prev)
+    except Exception:
+        pass
+
+    print("No 'More' control found on the page.")
+    return MoreResult.NOT_FOUND
+
+
+async def block_heavy_resources(route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def scrape_words(page, sink: Sink) -> Tuple[int, int]:
+    """
+    Page through the word list, passing each round's newly seen
+    (word, translation) pairs to `sink` in page order.
+    Returns (number of pairs collected, expected count or -1).
+    """
+    expected = await get_expected_count(page)
+    print(f"Expected count (from h2): {expected if expected != -1 else 'unknown'}")
+
+    collected: Set[Tuple[str, str]] = set()
+    scraped_idx = 0
+    largest_batch = 0
+    stagnant_rounds = 0
+
+    while True:
+        prev_idx = scraped_idx
+        visible, scraped_idx = await extract_visible_words(page, scraped_idx)
+        largest_batch = max(largest_batch, scraped_idx - prev_idx)
+        before = len(collected)
+        new_pairs = []
+        for pair in visible:
+            if pair not in collected:
+                collected.add(pair)
+                new_pairs.append(pair)
+        if new_pairs:
+            await sink(new_pairs)
+        after = len(collected)
+
+        print(f"Collected: {after} (added {after - before})")
+
+        # Stop condition if we know the expected count
+        if expected != -1 and after >= expected:
+            print("Reached expected count.")
+            break
+
+        # Try to load more
+        result = await click_more_if_possible(page, scraped_idx)
+
+        # If no "more" button, the list may load on scroll instead
+        if result is MoreResult.NOT_FOUND:
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            grew = await wait_for_more_items(page, scraped_idx, timeout=2_000)
+        else:
+            grew = result is MoreResult.GREW
+
+        # A click loaded nothing and fewer than one page is missing: further
+        # clicks would only repeat the same timed-out wait.
+        if result is MoreResult.NO_GROWTH and expected != -1 and expected - after <= largest_batch:
+            print(f"No more items loaded ({expected - after} short of expected). Stopping.")
+            break
+
+        # Detect stagnation (nothing new extracted or nothing loaded)
+        if after == before or not grew:
+            stagnant_rounds += 1
+        else:
+            stagnant_rounds = 0
+
+        if stagnant_rounds >= 3:
+            print("No new words detected after multiple attempts. Stopping.")
+            break
+
+    return len(collected), expected
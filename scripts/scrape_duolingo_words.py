@@ -1,116 +1,25 @@
 import asyncio
-import json
-import re
+import sys
 from pathlib import Path
-from typing import Dict, Tuple
 
+import orjson
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
+# Ensure project root is on sys.path for `import scraping` when run as a script
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scraping._core import WORD_ITEMS_SELECTOR, block_heavy_resources, scrape_words
+
 
 URL = "https://www.duolingo.com/practice-hub/words"
 CDP_ENDPOINT = "http://127.0.0.1:9222"
 
 OUT_DIR = Path("data")
 OUT_PATH = OUT_DIR / "duolingo_words.jsonl"
-
-
-def parse_expected_count(text: str) -> int:
-    # e.g. "427 words"
-    m = re.search(r"(\d[\d,]*)", text)
-    if not m:
-        return -1
-    return int(m.group(1).replace(",", ""))
-
-
-async def get_expected_count(page) -> int:
-    # Look for an h2 containing "words"
-    h2 = page.locator("h2", has_text="words").first
-    try:
-        txt = (await h2.inner_text()).strip()
-        return parse_expected_count(txt)
-    except Exception:
-        return -1
-
-
-async def extract_visible_words(page) -> Dict[Tuple[str, str], None]:
-    """
-    Duolingo uses randomized classnames, so we anchor on structure:
-    list items that contain an <h3> (word) and a <p> (translation).
-    """
-    items = page.locator("section ul li")
-    count = await items.count()
-
-    results: Dict[Tuple[str, str], None] = {}
-    for i in range(count):
-        li = items.nth(i)
-        h3 = li.locator("h3").first
-        p = li.locator("p").first
-        try:
-            word = (await h3.inner_text()).strip()
-            trans = (await p.inner_text()).strip()
-        except Exception:
-            continue
-
-        # Basic sanity: skip empties
-        if word and trans:
-            results[(word, trans)] = None
-
-    return results
-
-
-async def click_more_if_possible(page) -> bool:
-    """
-    Scroll down and click the button that loads more, if present.
-    Duolingo label varies; we try a few common text matches.
-    """
-    # Scroll the main window to the bottom to reveal any lazy "more" control.
-    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-    await page.wait_for_timeout(750)
-
-    # 1) Try an accessible button with a name containing "more" (case‑insensitive).
-    try:
-        btn = page.get_by_role("button", name=re.compile("more", re.IGNORECASE))
-        if await btn.count() > 0 and await btn.first.is_visible():
-            print("Clicking 'More' via ARIA role/name.")
-            await btn.first.click()
-            await page.wait_for_timeout(200)
-            return True
-    except Exception:
-        pass
-
-    # 2) Try common button text variants (case‑sensitive CSS :has-text).
-    selector_variants = [
-        "button:has-text('More')",
-        "button:has-text('more')",
-        "button:has-text('Show more')",
-        "button:has-text('Load more')",
-        "button:has-text('See more')",
-    ]
-    for sel in selector_variants:
-        loc = page.locator(sel).first
-        try:
-            if await loc.is_visible():
-                print(f"Clicking 'More' via selector: {sel}")
-                await loc.click()
-                await page.wait_for_timeout(200)
-                return True
-        except Exception:
-            continue
-
-    # 3) Fallback: any element inside the words section whose text contains "more".
-    try:
-        words_section = page.locator("section", has=page.locator("ul li h3")).first
-        text_more = words_section.get_by_text(re.compile("more", re.IGNORECASE))
-        if await text_more.count() > 0 and await text_more.first.is_visible():
-            print("Clicking 'More' via generic text match inside words section.")
-            await text_more.first.click()
-            await page.wait_for_timeout(200)
-            return True
-    except Exception:
-        pass
-
-    print("No 'More' control found on the page.")
-    return False
+# Streamed to while scraping; replaces OUT_PATH only once the run completes
+PARTIAL_PATH = OUT_PATH.with_name(OUT_PATH.name + ".partial")
 
 
 async def main() -> None:
@@ -131,71 +40,47 @@ async def main() -> None:
             if existing.url.startswith(URL):
                 page = existing
                 break
-        if page is None:
+        # Only a freshly opened tab is routed: an existing tab has already
+        # loaded its assets, and routing disables the HTTP cache.
+        opened_page = page is None
+        if opened_page:
             page = await context.new_page()
+            await page.route("**/*", block_heavy_resources)
             await page.goto(URL, wait_until="domcontentloaded")
 
         # If you're not logged in, this page will look wrong.
         # We don't automate SSO; we just wait for the list to appear.
         try:
-            await page.wait_for_selector("section ul li h3", timeout=20_000)
+            await page.wait_for_selector(f"{WORD_ITEMS_SELECTOR} h3", timeout=20_000)
         except PlaywrightTimeoutError:
             raise SystemExit(
                 "Couldn't find the word list. Make sure you're logged into Duolingo in the Brave CDP window "
                 "and that the Words page is fully loaded."
             )
 
-        expected = await get_expected_count(page)
-        print(f"Expected count (from h2): {expected if expected != -1 else 'unknown'}")
-
-        collected: Dict[Tuple[str, str], None] = {}
-        stagnant_rounds = 0
-
-        while True:
-            visible = await extract_visible_words(page)
-            before = len(collected)
-            collected.update(visible)
-            after = len(collected)
+        # Rows are written as they are scraped (in page order), so a crash
+        # mid-run still leaves everything collected so far in PARTIAL_PATH
+        # without clobbering the last complete output.
+        with PARTIAL_PATH.open("wb") as f:
 
-            print(f"Collected: {after} (added {after - before})")
+            async def write_jsonl(pairs):
+                # orjson emits UTF-8 bytes directly (non-ASCII kept as-is)
+                f.writelines(orjson.dumps({"word": word, "translation": trans}) + b"\n" for word, trans in pairs)
+                f.flush()
 
-            # Stop condition if we know the expected count
-            if expected != -1 and after >= expected:
-                print("Reached expected count.")
-                break
-
-            # Try to load more
-            loaded_more = await click_more_if_possible(page)
-
-            # If no "more" button (or it stopped working), attempt one more scroll+wait
-            if not loaded_more:
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(500)
-
-            # Detect stagnation (no new items appearing)
-            if after == before:
-                stagnant_rounds += 1
-            else:
-                stagnant_rounds = 0
+            total, expected = await scrape_words(page, write_jsonl)
 
-            if stagnant_rounds >= 3:
-                print("No new words detected after multiple attempts. Stopping.")
-                break
-
-        # Write output
-        with OUT_PATH.open("w", encoding="utf-8") as f:
-            for word, trans in sorted(collected.keys()):
-                f.write(json.dumps({"word": word, "translation": trans}, ensure_ascii=False) + "\n")
-
-        print(f"Wrote {len(collected)} items to {OUT_PATH}")
+        PARTIAL_PATH.replace(OUT_PATH)
+        print(f"Wrote {total} items to {OUT_PATH}")
 
         # Optional: enforce exact match if expected is known
-        if expected != -1 and len(collected) != expected:
-            print(f"WARNING: expected {expected}, got {len(collected)}. Some items may not have loaded.")
+        if expected != -1 and total != expected:
+            print(f"WARNING: expected {expected}, got {total}. Some items may not have loaded.")
 
+        if opened_page:
+            await page.unroute("**/*", block_heavy_resources)
         await browser.close()
 
 
 if __name__ == "__main__":
     asyncio.run(main())
-
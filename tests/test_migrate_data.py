@@ -0,0 +1,31 @@
+import database
+from migrate_data import migrate_data
+
+
+def test_migrate_data_skips_existing_and_duplicate_terms(tmp_path, monkeypatch, capsys, test_sessionmaker):
+    (tmp_path / "output.csv").write_text(
+        "Words (English),Word (Arabic script)\n"
+        "hello,مرحبا\n"  # already seeded
+        "cat,قطة\n"
+        "cat,قطة\n"  # duplicate within the CSV
+        "dog,كلب\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setenv("DATABASE_URL", str(test_sessionmaker.kw["bind"].url))
+
+    migrate_data()
+    assert "Successfully migrated 2 terms" in capsys.readouterr().out
+
+    migrate_data()
+    assert "Successfully migrated 0 terms" in capsys.readouterr().out
+
+    db = test_sessionmaker()
+    try:
+        pairs = [
+            (t.english_term, t.target_language_term)
+            for t in db.query(database.Term).order_by(database.Term.id_vocabulary)
+        ]
+    finally:
+        db.close()
+    assert pairs == [("hello", "مرحبا"), ("cat", "قطة"), ("dog", "كلب")]
@@ -0,0 +1,134 @@
+import asyncio
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from scraping._core import WORD_ITEMS_SELECTOR, parse_expected_count, scrape_words
+
+
+class FakeLocator:
+    def __init__(self, page, kind):
+        self.page = page
+        self.kind = kind
+
+    @property
+    def first(self):
+        return self
+
+    async def evaluate_all(self, js, start):
+        page = self.page
+        return {
+            "total": page.rendered,
+            "items": [list(pair) for pair in page.words[start:page.rendered]],
+        }
+
+    async def inner_text(self):
+        if self.kind == "heading" and self.page.heading is not None:
+            return self.page.heading
+        raise PlaywrightTimeoutError("no heading")
+
+    async def count(self):
+        return 1 if await self.is_visible() else 0
+
+    async def is_visible(self):
+        page = self.page
+        if self.kind != "button" or not page.has_button:
+            return False
+        return page.stuck_button or page.rendered < len(page.words)
+
+    async def scroll_into_view_if_needed(self):
+        pass
+
+    async def click(self):
+        self.page.load_more()
+
+    def get_by_text(self, *args, **kwargs):
+        return FakeLocator(self.page, "none")
+
+
+class FakePage:
+    """Minimal stand-in for the Playwright page used by scrape_words."""
+
+    def __init__(self, n_words, heading, per_load=50, has_button=True, stuck_button=False):
+        self.words = [(f"word{i}", f"translation{i}") for i in range(n_words)]
+        self.heading = heading
+        self.per_load = per_load
+        self.has_button = has_button
+        # Keep showing "More" after everything has loaded
+        self.stuck_button = stuck_button
+        self.rendered = min(per_load, n_words)
+        self.waited_ms = 0
+
+    def load_more(self):
+        self.rendered = min(self.rendered + self.per_load, len(self.words))
+
+    def locator(self, selector, has_text=None, has=None):
+        if selector == "h2":
+            return FakeLocator(self, "heading")
+        if selector == WORD_ITEMS_SELECTOR:
+            return FakeLocator(self, "items")
+        if selector.startswith("button"):
+            return FakeLocator(self, "button")
+        return FakeLocator(self, "none")
+
+    def get_by_role(self, role, name=None):
+        return FakeLocator(self, "button")
+
+    async def wait_for_function(self, js, arg, timeout):
+        _, prev = arg
+        if self.rendered > prev:
+            return
+        self.waited_ms += timeout
+        raise PlaywrightTimeoutError("timed out")
+
+    async def evaluate(self, js):
+        # window.scrollTo(...) loads the next batch on scroll-loaded lists
+        if not self.has_button:
+            self.load_more()
+
+
+def run_scrape(page):
+    written = []
+
+    async def sink(pairs):
+        written.extend(pairs)
+
+    total, expected = asyncio.run(scrape_words(page, sink))
+    return total, expected, written
+
+
+def test_parse_expected_count_with_thousands_separator():
+    assert parse_expected_count("1,234 words") == 1234
+    assert parse_expected_count("words") == -1
+
+
+def test_scrape_stops_at_expected_count():
+    page = FakePage(427, "427 words")
+    total, expected, written = run_scrape(page)
+    assert (total, expected) == (427, 427)
+    assert written == page.words
+    assert page.waited_ms == 0
+
+
+def test_scrape_stops_early_when_fewer_items_than_expected():
+    page = FakePage(400, "427 words", stuck_button=True)
+    total, expected, written = run_scrape(page)
+    assert (total, expected) == (400, 427)
+    assert written == page.words
+    # One timed-out click, then stop without further stagnation rounds
+    assert page.waited_ms == 10_000
+
+
+def test_scrape_scroll_loaded_list_without_more_control():
+    page = FakePage(427, "427 words", has_button=False)
+    total, expected, written = run_scrape(page)
+    assert total == 427
+    assert written == page.words
+
+
+def test_scrape_unknown_expected_count_stops_on_stagnation():
+    page = FakePage(427, None, has_button=False)
+    total, expected, written = run_scrape(page)
+    assert (total, expected) == (427, -1)
+    assert written == page.words
+    # Three short scroll waits before giving up, not multiple click timeouts
+    assert page.waited_ms <= 3 * 2_000